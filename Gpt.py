@@ -1,7 +1,6 @@
 import json
 from settings import DEFAULT_GPT_MODEL
 from openai import OpenAI
-from tiktoken import encoding_for_model
 from random import randint
 
 
@@ -65,6 +64,8 @@ class Gpt:
 
     def count_tokens(self):
         """Returns the number of tokens in the context window."""
+        from tiktoken import encoding_for_model
+
         encoding = encoding_for_model(self.model_name)
         num_tokens = 0
         for msg in self.context:
@@ -1,5 +1,4 @@
 from PyPDF2 import PdfReader
-from Gpt import Gpt
 from settings import DEFAULT_GPT_MODEL,MARKDOWN_PROMPT
 from utils import evaluate_query
 import re
@@ -84,6 +83,9 @@ def get_cis_recommendation_mappings(pdf_filename, toc_start, toc_end, rec_groupi
 
 
 def get_markdown_from_cis_section(gpt_key, output_folder, section):
+    # Gpt pulls in openai, so only load it once markdown generation actually runs
+    from Gpt import Gpt
+
     gpt = Gpt(gpt_key, MARKDOWN_PROMPT)
 
     markdown = gpt.answer_prompt("Section: {} \n Recommendations: {}".format(section["name"], section["content"]))
@@ -1,4 +1,5 @@
 DEFAULT_GPT_MODEL = "gpt-4o-mini-2024-07-18"
+WARMUP_ON_START = True  # Preload heavy dependencies in the background after the first render
 MARKDOWN_PROMPT = "Your job is to map the reccomendations in the input that belong to the specified section to markdown as below - and only those that belongs to the specified section. "\
                   "INPUT: "\
                   "    Section: 4.1.3"\
@@ -4,7 +4,8 @@ from pathlib import Path
 from utils import render_query_builder, pick_folder
 import io
 from streamlit.runtime.scriptrunner import add_script_run_ctx
-from pdf2markdown import get_cis_recommendation_mappings, get_markdown_from_cis_section
+from settings import WARMUP_ON_START
+from warmup import start_warmup, get_warmup_report
 import re
 import os
 import queue
@@ -73,6 +74,8 @@ def build_PdfDoc2Markdown_input_section(app):
 
         if submitted_get_sections:
             with app.spinner("Mapping sections from table of content..."):
+                # Imported here so PyPDF2 is not loaded before the first render
+                from pdf2markdown import get_cis_recommendation_mappings
                 pdf_file = io.BytesIO(uploaded_pdf.read())
                 mapping_output = get_cis_recommendation_mappings(pdf_file, toc_start, toc_end, rec_grouping, app.session_state.settings.query_rows)
                 app.session_state.outputs.mappings = mapping_output
@@ -137,6 +140,7 @@ PdfDoc2MarkdownToolInfo = ToolInfo(**{
 })
 
 def run_generation(app, gpt_key, out_dir: Path, job_id: str):
+    from pdf2markdown import get_markdown_from_cis_section
     out_dir.mkdir(parents=True, exist_ok=True)
 
     for i, s in enumerate(st.session_state.outputs.mappings, start=1):
@@ -226,6 +230,18 @@ with cols[0]:
     st.write(
         tool.about
     )
+
+    warmup_report = get_warmup_report()
+    if warmup_report is not None:
+        # The warm-up does not trigger a rerun when it finishes, the report is updated on the next interaction
+        with st.expander("Startup report"):
+            if not warmup_report.done.is_set():
+                st.caption("Warming up…")
+            elif warmup_report.failed():
+                st.caption(f"Warm-up finished with errors ({warmup_report.summary()})")
+            else:
+                st.caption(f"Dependencies preloaded ({warmup_report.summary()})")
+            st.dataframe(warmup_report.rows(), use_container_width=True, hide_index=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 # -------------------------------
@@ -296,3 +312,9 @@ with cols[2]:
         st.caption("Outputs store not initialized.")
 
     st.markdown("</div>", unsafe_allow_html=True)
+
+# -------------------------------
+# Warm-up (after first paint)
+# -------------------------------
+if WARMUP_ON_START:
+    start_warmup()
@@ -1,10 +1,12 @@
 from typing import List
-import tkinter as tk
-from tkinter import filedialog
 from uuid import uuid4
 
 def pick_folder(title="Select a folder"):
-    # Opens a native OS dialog on the machine running the Streamlit server
+    # Opens a native OS dialog on the machine running the Streamlit server.
+    # tkinter is imported here so the UI does not pay for it until Browse is clicked.
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
     root.attributes("-topmost", True)  # bring dialog to front
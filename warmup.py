@@ -0,0 +1,128 @@
+import importlib
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from settings import DEFAULT_GPT_MODEL
+
+# Modules that are slow to import and only needed once mapping or generation runs
+HEAVY_MODULES = ["PyPDF2", "openai", "tiktoken", "pdf2markdown", "Gpt"]
+
+# This module is imported once per process, unlike ui.py which Streamlit re-executes on every rerun
+_report: Optional["WarmupReport"] = None
+_report_lock = threading.Lock()
+
+
+class WarmupReport:
+
+    def __init__(self):
+        # (step, seconds, error) in the order the steps ran, seconds is None for failed steps
+        self.steps: List[Tuple[str, Optional[float], str]] = []
+        self.done = threading.Event()
+        # The UI reads the report while the warm-up thread is still adding steps
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: Optional[float], error: str = ""):
+        with self._lock:
+            self.steps.append((name, seconds, error))
+
+    def _snapshot(self) -> List[Tuple[str, Optional[float], str]]:
+        with self._lock:
+            return list(self.steps)
+
+    def rows(self) -> List[Dict[str, str]]:
+        """
+        Returns the recorded steps in a format that can be displayed as a table.
+        :return: One row per warm-up step, in the order they ran, with its duration in milliseconds
+        """
+        return [{"step": name, "ms": "" if seconds is None else f"{seconds * 1000:.0f}", "error": error}
+                for name, seconds, error in self._snapshot()]
+
+    def total(self) -> float:
+        return sum(seconds for _, seconds, _ in self._snapshot() if seconds is not None)
+
+    def failed(self) -> int:
+        return sum(1 for _, seconds, _ in self._snapshot() if seconds is None)
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary that does not hide failed steps.
+        :return: The time spent on successful steps and how many steps succeeded and failed
+        """
+        steps = self._snapshot()
+        failed = sum(1 for _, seconds, _ in steps if seconds is None)
+        total = sum(seconds for _, seconds, _ in steps if seconds is not None)
+        # Computed from one snapshot so the counts agree while the warm-up is still running
+        return f"{total:.2f}s, {len(steps) - failed} ok, {failed} failed"
+
+
+def _timed(report: WarmupReport, name: str, step: Callable[[], None]):
+    start = time.perf_counter()
+    try:
+        step()
+    except Exception as e:
+        # A failed warm-up step is not fatal, the real call will import it again and surface the error
+        report.record(name, None, str(e))
+    else:
+        report.record(name, time.perf_counter() - start)
+
+
+def _load_encoding(model_name):
+    from tiktoken import encoding_for_model
+    encoding_for_model(model_name)
+
+
+def _create_openai_client():
+    from openai import OpenAI
+    # The key is a placeholder and no request is made. The client is discarded, Gpt creates its own,
+    # but accessing chat.completions imports the resource modules the client otherwise loads lazily.
+    client = OpenAI(api_key="warmup")
+    client.chat.completions
+    client.close()
+
+
+def warm_up(report: Optional[WarmupReport] = None, model_name: str = DEFAULT_GPT_MODEL) -> WarmupReport:
+    """
+    Imports the heavy dependencies and preloads the tiktoken encoding and the OpenAI client,
+    recording how long each step took.
+    :param report: The report to record into, a new one is created if None
+    :param model_name: The model whose tiktoken encoding should be loaded
+    :return: The report with the time spent on each step
+    """
+    report = report or WarmupReport()
+    for module in HEAVY_MODULES:
+        _timed(report, f"import {module}", lambda: importlib.import_module(module))
+    _timed(report, f"tiktoken encoding ({model_name})", lambda: _load_encoding(model_name))
+    _timed(report, "OpenAI client", _create_openai_client)
+    report.done.set()
+    print(f"Warm-up finished ({report.summary()}): "
+          + ", ".join(f"{row['step']} {row['ms'] + 'ms' if row['ms'] else 'failed'}" for row in report.rows()))
+    return report
+
+
+def start_warmup(model_name: str = DEFAULT_GPT_MODEL) -> WarmupReport:
+    """
+    Runs warm_up on a daemon thread so it does not block rendering.
+    Only the first call starts a thread, later calls return the same report.
+    :param model_name: The model whose tiktoken encoding should be loaded
+    :return: The report, which is filled in as the warm-up progresses
+    """
+    global _report
+    with _report_lock:
+        if _report is None:
+            _report = WarmupReport()
+            threading.Thread(target=warm_up, args=(_report, model_name), daemon=True).start()
+        return _report
+
+
+def get_warmup_report() -> Optional[WarmupReport]:
+    """
+    Returns the report of the background warm-up without starting it.
+    :return: The report, or None if start_warmup has not been called in this process
+    """
+    return _report
+
+
+if __name__ == '__main__':
+    # Import-time report without starting Streamlit
+    for row in warm_up().rows():
+        print(row)